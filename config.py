@@ -9,6 +9,7 @@ load_dotenv()
 MAX_CONCURRENT_WORKERS = int(os.getenv('MAX_CONCURRENT_WORKERS', '1'))
 GOOGLE_MAPS_QUEUE_NAME = os.getenv('GOOGLE_MAPS_QUEUE_NAME', 'google_maps_scraper')
 EMAIL_QUEUE_NAME = os.getenv('EMAIL_QUEUE_NAME', 'email_scraper')
+JOB_EVENTS_CHANNEL = os.getenv('JOB_EVENTS_CHANNEL', 'job_events')
 
 # Retry Configuration  
 MAX_RETRIES = int(os.getenv('MAX_RETRIES', '5'))
@@ -0,0 +1,12 @@
+"""
+id_utils.py - ID helpers for the test scripts
+---------------------------------------------
+Generates batches of UUIDs for test job submissions.
+"""
+import os
+import uuid
+
+def bulk_uuid(n: int) -> list:
+    """Generate n random UUID4 strings from a single os.urandom call"""
+    buf = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=buf[i*16:(i+1)*16], version=4)) for i in range(n)]
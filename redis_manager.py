@@ -2,7 +2,7 @@ import redis
 import json
 import logging
 from typing import Dict, List, Optional
-from config import REDIS_HOST, REDIS_PORT, REDIS_DB, GOOGLE_MAPS_QUEUE_NAME, EMAIL_QUEUE_NAME
+from config import REDIS_HOST, REDIS_PORT, REDIS_DB, GOOGLE_MAPS_QUEUE_NAME, EMAIL_QUEUE_NAME, JOB_EVENTS_CHANNEL
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +73,21 @@ class RedisManager:
             logger.error(f"Failed to add job for retry: {e}")
             return False
     
+    def publish_part_done(self, job_id: str, part_id: str, status: str) -> bool:
+        """Publish a part_done event so listeners can track progress without polling"""
+        try:
+            event = {
+                'event': 'part_done',
+                'job_id': job_id,
+                'part_id': part_id,
+                'status': status
+            }
+            self.client.publish(JOB_EVENTS_CHANNEL, json.dumps(event))
+            return True
+        except Exception as e:
+            logger.error(f"Failed to publish event for part {part_id}: {e}")
+            return False
+    
     def get_queue_lengths(self) -> Dict[str, int]:
         """Get the length of all queues"""
         try:
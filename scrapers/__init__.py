@@ -5,7 +5,8 @@ from .redis_integration import (
     create_card_scraper, 
     create_tile_scraper, 
     create_hybrid_scraper, 
-    create_scraper
+    create_scraper,
+    get_supabase_adapter
 )
 from .strategies.card_strategy import CardStrategy
 from .strategies.tile_strategy import TileStrategy
@@ -18,6 +19,7 @@ __all__ = [
     'create_tile_scraper', 
     'create_hybrid_scraper', 
     'create_scraper',
+    'get_supabase_adapter',
     'CardStrategy', 
     'TileStrategy', 
     'HybridStrategy',
@@ -4,6 +4,7 @@ redis_integration.py - Integration with Redis job queue
 Provides the interface between Redis workers and the scraping strategies.
 """
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Tuple, List
 from datetime import datetime
 from config import SUPABASE_URL, SUPABASE_KEY, SCRAPER_DEBUG
@@ -13,6 +14,11 @@ from .strategies.card_strategy import CardStrategy
 from .strategies.tile_strategy import TileStrategy
 from .database.supabase_adapter import SupabaseAdapter
 
+@lru_cache(maxsize=1)
+def get_supabase_adapter(supabase_url: str, supabase_key: str) -> SupabaseAdapter:
+    """Return a shared SupabaseAdapter so scrapers reuse one Supabase client."""
+    return SupabaseAdapter(supabase_url, supabase_key)
+
 class RedisCardScraper:
     """
     Redis-compatible wrapper for scraping strategies.
@@ -27,7 +33,7 @@ class RedisCardScraper:
         if debug is None:
             debug = SCRAPER_DEBUG
         
-        self.supabase_adapter = SupabaseAdapter(supabase_url, supabase_key)
+        self.supabase_adapter = get_supabase_adapter(supabase_url, supabase_key)
         self.strategy_name = strategy
         self.log = logging.getLogger("redis_scraper")
         
@@ -3,9 +3,42 @@ simple_test.py - Simple test without complex imports
 --------------------------------------------------
 Direct test of individual strategies without going through the full import chain.
 """
+import io
+import sys
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+class ThreadBufferedStream(io.TextIOBase):
+    """Stand-in for sys.stdout/sys.stderr that collects each test thread's output in its own buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+    
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (buffer or self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+def run_buffered(test_name, test_func, streams):
+    """Run a test with the given streams buffered, returning (success, output)"""
+    buffer = io.StringIO()
+    for stream in streams:
+        stream.local.buffer = buffer
+    try:
+        success = test_func()
+    except Exception as e:
+        buffer.write(f"❌ {test_name} crashed: {e}\n")
+        success = False
+    finally:
+        for stream in streams:
+            stream.local.buffer = None
+    return success, buffer.getvalue()
+
 def test_card_strategy_direct():
     """Test card strategy directly"""
     print("🧪 Testing Card Strategy Directly")
@@ -148,17 +181,30 @@ if __name__ == "__main__":
         ("Tile Strategy", test_tile_strategy_direct)
     ]
     
+    # Tests share no state, so run them concurrently and print each one's
+    # output in a single block as it finishes
+    # (stderr too, so tracebacks stay with their test's block)
     results = {}
-    for test_name, test_func in tests:
-        try:
-            results[test_name] = test_func()
-        except Exception as e:
-            print(f"❌ {test_name} crashed: {e}")
-            results[test_name] = False
+    real_stdout, real_stderr = sys.stdout, sys.stderr
+    sys.stdout = ThreadBufferedStream(real_stdout)
+    sys.stderr = ThreadBufferedStream(real_stderr)
+    streams = (sys.stdout, sys.stderr)
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = {executor.submit(run_buffered, test_name, test_func, streams): test_name
+                       for test_name, test_func in tests}
+            for future in as_completed(futures):
+                success, output = future.result()
+                real_stdout.write(output)
+                real_stdout.flush()
+                results[futures[future]] = success
+    finally:
+        sys.stdout, sys.stderr = real_stdout, real_stderr
     
     # Summary
     print(f"\n📊 Test Results Summary")
     print("=" * 30)
-    for test_name, success in results.items():
+    for test_name, _ in tests:
+        success = results[test_name]
         status = "✅ PASS" if success else "❌ FAIL"
         print(f"  {test_name}: {status}")
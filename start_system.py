@@ -8,12 +8,25 @@ import sys
 import subprocess
 import time
 import signal
+import redis
 from pathlib import Path
 
+REDIS_HOST = '127.0.0.1'
+REDIS_PORT = 6379
+REDIS_STARTUP_ATTEMPTS = 50
+REDIS_STARTUP_INTERVAL = 0.05  # seconds between ping attempts
+FLASK_LOG_FILE = 'flask.log'
+
 class SystemManager:
     def __init__(self):
         self.redis_process = None
         self.flask_process = None
+        self.flask_log = None
+        self.app_path = Path('app.py').resolve()
+        self.has_app = self.app_path.is_file()
+        self.has_env = Path('.env').is_file()
+        self.redis_client = redis.Redis(host=REDIS_HOST, port=REDIS_PORT,
+                                        socket_connect_timeout=0.2)
     
     def check_redis_installed(self):
         """Check if Redis is installed"""
@@ -24,6 +37,17 @@ class SystemManager:
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
     
+    def wait_for_redis(self):
+        """Ping Redis until it answers or the startup attempts run out"""
+        for _ in range(REDIS_STARTUP_ATTEMPTS):
+            try:
+                if self.redis_client.ping():
+                    return True
+            except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError):
+                pass
+            time.sleep(REDIS_STARTUP_INTERVAL)
+        return False
+    
     def start_redis(self):
         """Start Redis server"""
         if not self.check_redis_installed():
@@ -36,18 +60,18 @@ class SystemManager:
         
         print("🚀 Starting Redis server...")
         try:
-            # Start Redis in background
+            # Start Redis as a tracked child process (not daemonized) so it
+            # can be stopped through its PID; its own session keeps Ctrl+C
+            # from reaching it before stop_services runs
             self.redis_process = subprocess.Popen(
-                ['redis-server', '--daemonize', 'yes'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                ['redis-server', '--port', str(REDIS_PORT)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
             )
-            time.sleep(2)  # Give Redis time to start
             
-            # Test Redis connection
-            result = subprocess.run(['redis-cli', 'ping'], 
-                                  capture_output=True, text=True)
-            if result.stdout.strip() == 'PONG':
+            # Wait for Redis to accept connections
+            if self.wait_for_redis():
                 print("✅ Redis server started successfully")
                 return True
             else:
@@ -62,18 +86,18 @@ class SystemManager:
         print("🚀 Starting Flask application...")
         try:
             # Check if app.py exists
-            if not Path('app.py').exists():
+            if not self.has_app:
                 print("❌ app.py not found!")
                 return False
             
-            # Start Flask app
+            # Start Flask app, sending its output to a log file so a
+            # full pipe can never block the server
+            self.flask_log = open(FLASK_LOG_FILE, 'ab')
+            log_offset = self.flask_log.tell()
             self.flask_process = subprocess.Popen(
-                [sys.executable, 'app.py'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                [sys.executable, str(self.app_path)],
+                stdout=self.flask_log,
+                stderr=subprocess.STDOUT
             )
             
             # Wait a bit and check if it's running
@@ -81,11 +105,14 @@ class SystemManager:
             if self.flask_process.poll() is None:
                 print("✅ Flask application started successfully")
                 print("🌐 Server running at http://localhost:5000")
+                print(f"📝 Flask output: {FLASK_LOG_FILE}")
                 return True
             else:
                 print("❌ Flask application failed to start")
-                # Print any error output
-                output, _ = self.flask_process.communicate()
+                # Print any error output written during this run
+                with open(FLASK_LOG_FILE, 'rb') as log:
+                    log.seek(log_offset)
+                    output = log.read().decode(errors='replace')
                 if output:
                     print(f"Error output: {output}")
                 return False
@@ -107,12 +134,20 @@ class SystemManager:
                 self.flask_process.kill()
                 print("🔪 Flask force killed")
         
-        # Stop Redis
-        try:
-            subprocess.run(['redis-cli', 'shutdown'], 
-                         capture_output=True, check=True)
-            print("✅ Redis stopped")
-        except subprocess.CalledProcessError:
+        if self.flask_log:
+            self.flask_log.close()
+            self.flask_log = None
+        
+        # Stop Redis (SIGTERM makes it save and exit cleanly)
+        if self.redis_process and self.redis_process.poll() is None:
+            self.redis_process.send_signal(signal.SIGTERM)
+            try:
+                self.redis_process.wait(timeout=5)
+                print("✅ Redis stopped")
+            except subprocess.TimeoutExpired:
+                self.redis_process.kill()
+                print("🔪 Redis force killed")
+        else:
             print("⚠️  Redis may already be stopped")
     
     def run(self):
@@ -121,7 +156,7 @@ class SystemManager:
         print("=" * 50)
         
         # Check environment
-        if not Path('.env').exists():
+        if not self.has_env:
             print("❌ .env file not found!")
             print("Create .env with your Supabase credentials")
             return False
@@ -143,14 +178,11 @@ class SystemManager:
             print("  Worker status: http://localhost:5000/api/workers/status")
             print("\nPress Ctrl+C to stop the system")
             
-            # Keep running until interrupted
+            # Block until Flask exits; Ctrl+C raises KeyboardInterrupt out of
+            # the wait and stop_services() below handles the shutdown
             try:
-                while True:
-                    time.sleep(1)
-                    # Check if Flask is still running
-                    if self.flask_process.poll() is not None:
-                        print("❌ Flask process died")
-                        break
+                self.flask_process.wait()
+                print("❌ Flask process died")
             except KeyboardInterrupt:
                 print("\n🛑 Shutdown requested")
             
@@ -165,16 +197,11 @@ def main():
     """Main function"""
     manager = SystemManager()
     
-    # Handle Ctrl+C gracefully
-    def signal_handler(sig, frame):
+    # Run the system; run() stops services on Ctrl+C, even mid-startup
+    try:
+        manager.run()
+    except KeyboardInterrupt:
         print("\n🛑 Interrupt received")
-        manager.stop_services()
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    
-    # Run the system
-    manager.run()
 
 if __name__ == "__main__":
     main()
@@ -1,18 +1,53 @@
-import requests
+import aiohttp
+import asyncio
 import json
-import time
-import uuid
+import redis.asyncio
 from datetime import datetime
+from id_utils import bulk_uuid
 
 # Configuration
 BASE_URL = "http://localhost:5000"
+REDIS_URL = "redis://localhost:6379/0"
+JOB_EVENTS_CHANNEL = "job_events"  # Must match JOB_EVENTS_CHANNEL in config.py
+MAX_CONNECTIONS = 16  # Size of the shared keep-alive connection pool
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.1  # seconds (doubled on each retry)
+POLL_BASE_DELAY = 0.25  # seconds (doubled on each status check)
+POLL_MAX_DELAY = 4
+POLL_DEADLINE = 60
 
-def test_job_submission():
+# Fields shared by every part of the test job
+COMMON_PART_FIELDS = {
+    "keyword": "restaurants",
+    "city": "New York",
+    "state": "NY",
+    "country": "USA"
+}
+TEST_POSTCODES = ("10001", "10002", "10003")
+
+def create_session() -> aiohttp.ClientSession:
+    """Create an HTTP session backed by a pooled keep-alive connector"""
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, keepalive_timeout=30)
+    return aiohttp.ClientSession(connector=connector)
+
+async def _request_json(session: aiohttp.ClientSession, method: str, path: str, **kwargs):
+    """Send a request and return (status, decoded JSON), retrying failed connects"""
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with session.request(method, f"{BASE_URL}{path}", **kwargs) as response:
+                return response.status, await response.json()
+        except aiohttp.ClientConnectorError:
+            if attempt == MAX_RETRIES:
+                raise
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+async def test_job_submission(session: aiohttp.ClientSession):
     """Test submitting a job to the Redis server with proper UUIDs"""
     
     # Generate proper UUIDs
-    job_id = str(uuid.uuid4())
-    profile_id = str(uuid.uuid4())  # This should be a real profile_id from your database
+    job_id, profile_id, *part_ids = bulk_uuid(2 + len(TEST_POSTCODES))
+    # profile_id should be a real profile_id from your database
+    created_at = datetime.now().isoformat()
     
     # Sample job data with proper UUIDs
     job_data = {
@@ -20,81 +55,145 @@ def test_job_submission():
         "profile_id": profile_id,  # Real profile UUID
         "scraper_engine": "google_maps",
         "job_parts": [
-            {
-                "part_id": str(uuid.uuid4()),  # Real part UUID
-                "postcode": "10001",
-                "keyword": "restaurants",
-                "city": "New York",
-                "state": "NY",
-                "country": "USA"
-            },
-            {
-                "part_id": str(uuid.uuid4()),  # Real part UUID
-                "postcode": "10002",
-                "keyword": "restaurants",
-                "city": "New York",
-                "state": "NY",
-                "country": "USA"
-            },
-            {
-                "part_id": str(uuid.uuid4()),  # Real part UUID
-                "postcode": "10003",
-                "keyword": "restaurants",
-                "city": "New York",
-                "state": "NY",
-                "country": "USA"
-            }
+            {"part_id": part_id, "postcode": postcode, **COMMON_PART_FIELDS}  # Real part UUID
+            for part_id, postcode in zip(part_ids, TEST_POSTCODES)
         ],
-        "created_at": datetime.now().isoformat()
+        "created_at": created_at
     }
     
     print("Testing job submission with proper UUIDs...")
     print(f"Job ID: {job_id}")
     print(f"Profile ID: {profile_id}")
-    response = requests.post(f"{BASE_URL}/api/jobs/submit", json=job_data)
-    print(f"Response: {response.status_code} - {response.json()}")
+    status, body = await _request_json(session, "POST", "/api/jobs/submit", json=job_data)
+    print(f"Response: {status} - {body}")
     
-    return job_data["job_id"]
+    return job_data["job_id"], status, len(job_data["job_parts"])
+
+async def _get_json(session: aiohttp.ClientSession, path: str):
+    """GET an endpoint and return its decoded JSON body"""
+    _, body = await _request_json(session, "GET", path)
+    return body
 
-def test_system_status():
+async def test_system_status(session: aiohttp.ClientSession):
     """Test various status endpoints"""
     
+    # Fire all three requests at once; total latency is bounded by the slowest
+    health, queues, workers = await asyncio.gather(
+        _get_json(session, "/api/system/health"),
+        _get_json(session, "/api/queues/status"),
+        _get_json(session, "/api/workers/status")
+    )
+    
     print("\n=== System Health ===")
-    response = requests.get(f"{BASE_URL}/api/system/health")
-    print(f"Health: {response.json()}")
+    print(f"Health: {health}")
     
     print("\n=== Queue Status ===")
-    response = requests.get(f"{BASE_URL}/api/queues/status")
-    print(f"Queues: {response.json()}")
+    print(f"Queues: {queues}")
     
     print("\n=== Workers Status ===")
-    response = requests.get(f"{BASE_URL}/api/workers/status")
-    print(f"Workers: {response.json()}")
+    print(f"Workers: {workers}")
 
-def test_job_status(job_id: str):
+async def test_job_status(session: aiohttp.ClientSession, job_id: str):
     """Test job status endpoint"""
+    job_status = await _get_json(session, f"/api/jobs/status/{job_id}")
     print(f"\n=== Job Status for {job_id} ===")
-    response = requests.get(f"{BASE_URL}/api/jobs/status/{job_id}")
-    print(f"Job Status: {response.json()}")
+    print(f"Job Status: {job_status}")
+    return job_status
+
+def _is_job_finished(job_status: dict) -> bool:
+    """A job is finished once every part is either done or failed"""
+    stats = job_status.get('stats') or {}
+    total = stats.get('total', 0)
+    return total > 0 and stats.get('done', 0) + stats.get('failed', 0) >= total
 
-def run_full_test():
+async def poll_until_done(session: aiohttp.ClientSession, job_id: str, deadline: float = POLL_DEADLINE) -> bool:
+    """Poll job status with exponential backoff until it finishes or the deadline passes"""
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    attempt = 0
+    
+    while True:
+        elapsed = loop.time() - started
+        print(f"\n--- Check {attempt+1} (after {elapsed:.1f} seconds) ---")
+        if _is_job_finished(await test_job_status(session, job_id)):
+            return True
+        
+        delay = min(POLL_MAX_DELAY, POLL_BASE_DELAY * 2 ** attempt)
+        if elapsed + delay > deadline:
+            return False
+        await asyncio.sleep(delay)
+        attempt += 1
+
+async def subscribe_job_events(pubsub) -> bool:
+    """Subscribe to worker job events, returning False if Redis is unreachable"""
+    try:
+        await pubsub.subscribe(JOB_EVENTS_CHANNEL)
+        return True
+    except (redis.exceptions.ConnectionError, OSError) as e:
+        print(f"Job events unavailable ({e}), falling back to status polling")
+        return False
+
+async def wait_for_parts(pubsub, job_id: str, pending: int, deadline: float = POLL_DEADLINE) -> bool:
+    """Count down part_done events for a job until none are pending or the deadline passes"""
+    loop = asyncio.get_running_loop()
+    expires_at = loop.time() + deadline
+    
+    while pending > 0:
+        remaining = expires_at - loop.time()
+        if remaining <= 0:
+            return False
+        
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+        if message is None:
+            continue
+        
+        event = json.loads(message['data'])
+        if event.get('event') == 'part_done' and event.get('job_id') == job_id:
+            pending -= 1
+            print(f"Part {event['part_id']} {event['status']} ({pending} remaining)")
+    
+    return True
+
+async def run_full_test(session: aiohttp.ClientSession, events: redis.asyncio.Redis):
     """Run a complete test scenario"""
     print("Starting full test scenario...")
     
     # Test system health first
-    test_system_status()
+    await test_system_status(session)
     
-    # Submit a test job
-    job_id = test_job_submission()
+    async with events.pubsub() as pubsub:
+        # Subscribe before submitting so no part_done event is missed
+        subscribed = await subscribe_job_events(pubsub)
+        
+        # Submit a test job
+        job_id, status, part_count = await test_job_submission(session)
+        
+        # Monitor job progress from worker events rather than polling the API
+        if not 200 <= status < 300:
+            finished = None
+        elif subscribed:
+            finished = await wait_for_parts(pubsub, job_id, part_count)
+        else:
+            finished = await poll_until_done(session, job_id)
     
-    # Monitor job progress
-    for i in range(10):
-        time.sleep(5)
-        print(f"\n--- Check {i+1} (after {(i+1)*5} seconds) ---")
-        test_job_status(job_id)
-        test_system_status()
+    if finished is None:
+        print("\nJob submission failed, skipping progress monitoring")
+    elif finished:
+        print("\nJob finished")
+    else:
+        print(f"\nJob still running after {POLL_DEADLINE} seconds")
+    await asyncio.gather(
+        test_job_status(session, job_id),
+        test_system_status(session)
+    )
     
     print("\nTest completed!")
 
+async def main():
+    """Run the full test with one shared HTTP session and Redis connection"""
+    async with create_session() as session, \
+            redis.asyncio.from_url(REDIS_URL, decode_responses=True) as events:
+        await run_full_test(session, events)
+
 if __name__ == "__main__":
-    run_full_test()
+    asyncio.run(main())
@@ -3,36 +3,37 @@ test_strategies.py - Test different scraping strategies
 -----------------------------------------------------
 Test script to compare card, tile, and hybrid strategies.
 """
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from scrapers.redis_integration import create_card_scraper, create_tile_scraper, create_hybrid_scraper
+from id_utils import bulk_uuid
 
 def test_strategy(strategy_name: str, scraper, job_part_data: dict):
-    """Test a specific scraping strategy"""
+    """Test a specific scraping strategy (no output, so strategies can run concurrently)"""
+    try:
+        return scraper.process_job_part(job_part_data)
+    except Exception as e:
+        return False, {'error': str(e), 'crashed': True}
+
+def report_strategy(strategy_name: str, success: bool, result: dict):
+    """Print the outcome of a strategy test"""
     print(f"\n{'='*60}")
     print(f"🧪 Testing {strategy_name.upper()} Strategy")
     print(f"{'='*60}")
     
-    try:
-        success, result = scraper.process_job_part(job_part_data)
-        
-        if success:
-            print(f"✅ {strategy_name} strategy completed successfully!")
-            print(f"📊 Records found: {result.get('records_found', 0)}")
-            print(f"🔧 Items processed: {result.get('items_processed', 0)}")
-            print(f"💾 Database inserted: {result.get('database_inserted', False)}")
-            
-            if 'strategy_used' in result:
-                print(f"🎯 Actual strategy used: {result['strategy_used']}")
-        else:
-            print(f"❌ {strategy_name} strategy failed!")
-            print(f"Error: {result.get('error', 'Unknown error')}")
+    if success:
+        print(f"✅ {strategy_name} strategy completed successfully!")
+        print(f"📊 Records found: {result.get('records_found', 0)}")
+        print(f"🔧 Items processed: {result.get('items_processed', 0)}")
+        print(f"💾 Database inserted: {result.get('database_inserted', False)}")
         
-        return success, result
-        
-    except Exception as e:
-        print(f"❌ {strategy_name} strategy crashed: {e}")
-        return False, {'error': str(e)}
+        if 'strategy_used' in result:
+            print(f"🎯 Actual strategy used: {result['strategy_used']}")
+    elif result.get('crashed'):
+        print(f"❌ {strategy_name} strategy crashed: {result['error']}")
+    else:
+        print(f"❌ {strategy_name} strategy failed!")
+        print(f"Error: {result.get('error', 'Unknown error')}")
 
 def main():
     """Test all scraping strategies"""
@@ -40,9 +41,7 @@ def main():
     print("=" * 60)
     
     # Create test job part data with proper UUIDs
-    job_id = str(uuid.uuid4())
-    part_id = str(uuid.uuid4())
-    profile_id = str(uuid.uuid4())
+    job_id, part_id, profile_id = bulk_uuid(3)
     
     job_part_data = {
         'job_id': job_id,
@@ -64,17 +63,22 @@ def main():
     print(f"🆔 Job ID: {job_id}")
     print(f"🆔 Part ID: {part_id}")
     
-    # Test strategies
+    # Test strategies (all scrapers share one cached SupabaseAdapter)
     strategies = [
         ('Hybrid', create_hybrid_scraper()),
         ('Card', create_card_scraper()),
         ('Tile', create_tile_scraper())
     ]
     
-    results = {}
+    # Each strategy is dominated by scraping latency, so run them side by side
+    # and report each one afterwards to keep their output from interleaving
+    with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+        outcomes = list(executor.map(
+            lambda entry: test_strategy(*entry, job_part_data), strategies))
     
-    for strategy_name, scraper in strategies:
-        success, result = test_strategy(strategy_name, scraper, job_part_data)
+    results = {}
+    for (strategy_name, _), (success, result) in zip(strategies, outcomes):
+        report_strategy(strategy_name, success, result)
         results[strategy_name] = {'success': success, 'result': result}
     
     # Summary
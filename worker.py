@@ -75,6 +75,7 @@ class JobWorker:
             
             # Mark as completed
             db.update_job_part_status(part_id, 'done')
+            redis_manager.publish_part_done(job_id, part_id, 'done')
             self.processed_count += 1
             
             # Check if the entire job is completed
@@ -107,6 +108,7 @@ class JobWorker:
             # Max retries reached, mark as failed
             logger.error(f"Part {part_id} failed permanently after {MAX_RETRIES} attempts")
             db.update_job_part_status(part_id, 'failed')
+            redis_manager.publish_part_done(job_part['job_id'], part_id, 'failed')
             self.failed_count += 1
             
             # Still check if job is completed (other parts might be done)